@@ -143,9 +143,16 @@ def check_query_result_pl(result: pl.DataFrame, query_number: int) -> None:
 def check_query_result_pd(result: pd.DataFrame, query_number: int) -> None:
     """Assert that the pandas result of the query is correct."""
     from pandas.testing import assert_frame_equal
+    from pyarrow import Table
 
     expected = _get_query_answer_pd(query_number)
-    assert_frame_equal(result.reset_index(drop=True), expected, check_dtype=False)
+    result = result.reset_index(drop=True)
+
+    # Skip the column-wise comparison if the data is identical in Arrow
+    if Table.from_pandas(result).equals(Table.from_pandas(expected)):
+        return
+
+    assert_frame_equal(result, expected, check_dtype=False)
 
 
 def _get_query_answer_pl(query: int) -> pl.DataFrame:
@@ -29,12 +29,8 @@ def _read_ds(table_name: str) -> pd.DataFrame:
     if settings.run.io_type in ("parquet", "skip"):
         return pd.read_parquet(path, dtype_backend="pyarrow")
     elif settings.run.io_type == "csv":
-        df = pd.read_csv(path, dtype_backend="pyarrow")
-        # TODO: This is slow - we should use the known schema to read dates directly
-        for c in df.columns:
-            if c.endswith("date"):
-                df[c] = df[c].astype("date32[day][pyarrow]")
-        return df
+        # The pyarrow engine parses the ISO dates directly into date32 columns
+        return pd.read_csv(path, engine="pyarrow", dtype_backend="pyarrow")
     elif settings.run.io_type == "feather":
         return pd.read_feather(path, dtype_backend="pyarrow")
     else:
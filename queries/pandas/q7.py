@@ -16,12 +16,25 @@ def q() -> None:
     orders_ds = utils.get_orders_ds
     supplier_ds = utils.get_supplier_ds
 
+    # only read the columns used in the query
+    nation_cols = ["n_nationkey", "n_name"]
+    customer_cols = ["c_custkey", "c_nationkey"]
+    line_item_cols = [
+        "l_orderkey",
+        "l_suppkey",
+        "l_shipdate",
+        "l_extendedprice",
+        "l_discount",
+    ]
+    orders_cols = ["o_orderkey", "o_custkey"]
+    supplier_cols = ["s_suppkey", "s_nationkey"]
+
     # first call one time to cache in case we don't include the IO times
-    nation_ds()
-    customer_ds()
-    line_item_ds()
-    orders_ds()
-    supplier_ds()
+    nation_ds(nation_cols)
+    customer_ds(customer_cols)
+    line_item_ds(line_item_cols)
+    orders_ds(orders_cols)
+    supplier_ds(supplier_cols)
 
     def query() -> pd.DataFrame:
         nonlocal nation_ds
@@ -29,11 +42,11 @@ def q() -> None:
         nonlocal line_item_ds
         nonlocal orders_ds
         nonlocal supplier_ds
-        nation_ds = nation_ds()
-        customer_ds = customer_ds()
-        line_item_ds = line_item_ds()
-        orders_ds = orders_ds()
-        supplier_ds = supplier_ds()
+        nation_ds = nation_ds(nation_cols)
+        customer_ds = customer_ds(customer_cols)
+        line_item_ds = line_item_ds(line_item_cols)
+        orders_ds = orders_ds(orders_cols)
+        supplier_ds = supplier_ds(supplier_cols)
 
         var1 = "FRANCE"
         var2 = "GERMANY"
@@ -3,6 +3,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any
 
 import pandas as pd
+from pyarrow import csv as pa_csv
 
 from queries.common_utils import (
     check_query_result_pd,
@@ -20,63 +21,61 @@ settings = Settings()
 pd.options.mode.copy_on_write = True
 
 
-def _read_ds(table_name: str) -> pd.DataFrame:
+def _read_ds(table_name: str, columns: list[str] | None = None) -> pd.DataFrame:
     path = get_table_path(table_name)
 
     if settings.run.io_type in ("parquet", "skip"):
-        return pd.read_parquet(path, dtype_backend="pyarrow")
+        return pd.read_parquet(path, columns=columns, dtype_backend="pyarrow")
     elif settings.run.io_type == "csv":
-        df = pd.read_csv(path, dtype_backend="pyarrow")
-        # TODO: This is slow - we should use the known schema to read dates directly
-        for c in df.columns:
-            if c.endswith("date"):
-                df[c] = df[c].astype("date32[day][pyarrow]")  # type: ignore[call-overload]
-        return df
+        # The pyarrow reader parses the ISO dates directly into date32 columns
+        convert_options = pa_csv.ConvertOptions(include_columns=columns)
+        table = pa_csv.read_csv(path, convert_options=convert_options)
+        return table.to_pandas(types_mapper=pd.ArrowDtype)  # type: ignore[no-any-return]
     elif settings.run.io_type == "feather":
-        return pd.read_feather(path, dtype_backend="pyarrow")
+        return pd.read_feather(path, columns=columns, dtype_backend="pyarrow")
     else:
         msg = f"unsupported file type: {settings.run.io_type!r}"
         raise ValueError(msg)
 
 
 @on_second_call
-def get_line_item_ds() -> pd.DataFrame:
-    return _read_ds("lineitem")
+def get_line_item_ds(columns: list[str] | None = None) -> pd.DataFrame:
+    return _read_ds("lineitem", columns)
 
 
 @on_second_call
-def get_orders_ds() -> pd.DataFrame:
-    return _read_ds("orders")
+def get_orders_ds(columns: list[str] | None = None) -> pd.DataFrame:
+    return _read_ds("orders", columns)
 
 
 @on_second_call
-def get_customer_ds() -> pd.DataFrame:
-    return _read_ds("customer")
+def get_customer_ds(columns: list[str] | None = None) -> pd.DataFrame:
+    return _read_ds("customer", columns)
 
 
 @on_second_call
-def get_region_ds() -> pd.DataFrame:
-    return _read_ds("region")
+def get_region_ds(columns: list[str] | None = None) -> pd.DataFrame:
+    return _read_ds("region", columns)
 
 
 @on_second_call
-def get_nation_ds() -> pd.DataFrame:
-    return _read_ds("nation")
+def get_nation_ds(columns: list[str] | None = None) -> pd.DataFrame:
+    return _read_ds("nation", columns)
 
 
 @on_second_call
-def get_supplier_ds() -> pd.DataFrame:
-    return _read_ds("supplier")
+def get_supplier_ds(columns: list[str] | None = None) -> pd.DataFrame:
+    return _read_ds("supplier", columns)
 
 
 @on_second_call
-def get_part_ds() -> pd.DataFrame:
-    return _read_ds("part")
+def get_part_ds(columns: list[str] | None = None) -> pd.DataFrame:
+    return _read_ds("part", columns)
 
 
 @on_second_call
-def get_part_supp_ds() -> pd.DataFrame:
-    return _read_ds("partsupp")
+def get_part_supp_ds(columns: list[str] | None = None) -> pd.DataFrame:
+    return _read_ds("partsupp", columns)
 
 
 def run_query(query_number: int, query: Callable[..., Any]) -> None:
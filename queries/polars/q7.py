@@ -19,38 +19,47 @@ def q() -> None:
     var3 = date(1995, 1, 1)
     var4 = date(1996, 12, 31)
 
-    n1 = nation.filter(pl.col("n_name") == var1)
-    n2 = nation.filter(pl.col("n_name") == var2)
-
-    q1 = (
-        customer.join(n1, left_on="c_nationkey", right_on="n_nationkey")
-        .join(orders, left_on="c_custkey", right_on="o_custkey")
-        .rename({"n_name": "cust_nation"})
-        .join(lineitem, left_on="o_orderkey", right_on="l_orderkey")
-        .join(supplier, left_on="l_suppkey", right_on="s_suppkey")
-        .join(n2, left_on="s_nationkey", right_on="n_nationkey")
-        .rename({"n_name": "supp_nation"})
+    lineitem = lineitem.filter(
+        pl.col("l_shipdate").is_between(var3, var4)
+    ).with_columns(
+        (pl.col("l_extendedprice") * (1 - pl.col("l_discount"))).alias("volume"),
+        # The ship date range spans exactly two years
+        pl.when(pl.col("l_shipdate") < date(var4.year, 1, 1))
+        .then(var3.year)
+        .otherwise(var4.year)
+        .alias("l_year"),
     )
 
-    q2 = (
-        customer.join(n2, left_on="c_nationkey", right_on="n_nationkey")
-        .join(orders, left_on="c_custkey", right_on="o_custkey")
-        .rename({"n_name": "cust_nation"})
-        .join(lineitem, left_on="o_orderkey", right_on="l_orderkey")
-        .join(supplier, left_on="l_suppkey", right_on="s_suppkey")
-        .join(n1, left_on="s_nationkey", right_on="n_nationkey")
-        .rename({"n_name": "supp_nation"})
+    nations = nation.filter(pl.col("n_name").is_in([var1, var2]))
+    supp_nations = nations.select(
+        pl.col("n_nationkey").alias("s_nationkey"),
+        pl.col("n_name").alias("supp_nation"),
+    )
+    cust_nations = nations.select(
+        pl.col("n_nationkey").alias("c_nationkey"),
+        pl.col("n_name").alias("cust_nation"),
     )
 
     q_final = (
-        pl.concat([q1, q2])
-        .filter(pl.col("l_shipdate").is_between(var3, var4))
-        .with_columns(
-            (pl.col("l_extendedprice") * (1 - pl.col("l_discount"))).alias("volume"),
-            pl.col("l_shipdate").dt.year().alias("l_year"),
+        customer.join(
+            nations, left_on="c_nationkey", right_on="n_nationkey", how="semi"
+        )
+        .join(orders, left_on="c_custkey", right_on="o_custkey")
+        .join(lineitem, left_on="o_orderkey", right_on="l_orderkey")
+        .join(
+            supplier.join(
+                nations, left_on="s_nationkey", right_on="n_nationkey", how="semi"
+            ),
+            left_on="l_suppkey",
+            right_on="s_suppkey",
         )
-        .group_by("supp_nation", "cust_nation", "l_year")
+        # With only two nations left, a valid pair is one that crosses the border
+        .filter(pl.col("c_nationkey") != pl.col("s_nationkey"))
+        .group_by("s_nationkey", "c_nationkey", "l_year")
         .agg(pl.sum("volume").alias("revenue"))
+        .join(supp_nations, on="s_nationkey")
+        .join(cust_nations, on="c_nationkey")
+        .select("supp_nation", "cust_nation", "l_year", "revenue")
         .sort(by=["supp_nation", "cust_nation", "l_year"])
     )
 
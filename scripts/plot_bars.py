@@ -55,12 +55,22 @@ LIMIT = settings.plot.y_limit or Y_LIMIT_MAP[settings.run.io_type]
 
 def main() -> None:
     pl.Config.set_tbl_rows(100)
-    df = prep_data()
-    plot(df)
-
-
-def prep_data() -> pl.DataFrame:
-    lf = pl.scan_csv(settings.paths.timings / settings.paths.timings_filename)
+    df, solution_order = prep_data()
+    plot(df, solution_order)
+
+
+def prep_data() -> tuple[pl.DataFrame, pl.DataFrame]:
+    lf = pl.scan_csv(
+        settings.paths.timings / settings.paths.timings_filename,
+        schema={
+            "solution": pl.String,
+            "version": pl.String,
+            "query_number": pl.Int64,
+            "duration[s]": pl.Float64,
+            "io_type": pl.String,
+            "scale_factor": pl.Float64,
+        },
+    )
 
     # Scale factor not used at the moment
     lf = lf.drop("scale_factor")
@@ -75,36 +85,59 @@ def prep_data() -> pl.DataFrame:
     lf = lf.group_by("solution", "version", "query_number").last()
 
     # Insert missing query entries
-    groups = lf.select("solution", "version").unique()
-    queries = pl.LazyFrame({"query_number": range(1, settings.plot.n_queries + 1)})
-    groups_queries = groups.join(queries, how="cross")
-    lf = groups_queries.join(lf, on=["solution", "version", "query_number"], how="left")
-    lf = lf.with_columns(pl.col("duration[s]").fill_null(0))
-
-    # Order the groups
-    solutions_in_data = lf.select("solution").collect().to_series().unique()
-    solution = pl.LazyFrame({"solution": [s for s in COLORS if s in solutions_in_data]})
-    lf = solution.join(lf, on=["solution"], how="left")
-
-    # Make query number a string
+    queries = [str(i) for i in range(1, settings.plot.n_queries + 1)]
+    df = lf.collect().pivot(
+        on="query_number", index=["solution", "version"], values="duration[s]"
+    )
+    missing = [pl.lit(0.0).alias(q) for q in queries if q not in df.columns]
+    lf = (
+        df.with_columns(missing)
+        .fill_null(0)
+        .lazy()
+        .unpivot(
+            on=queries,
+            index=["solution", "version"],
+            variable_name="query_number",
+            value_name="duration[s]",
+        )
+    )
+
+    # Order the groups, keeping only the solutions present in the data
+    solution_order = (
+        pl.LazyFrame({"solution": list(COLORS)})
+        .with_row_index("order")
+        .join(df.lazy(), on="solution", how="semi")
+        .collect()
+    )
+    lf = lf.join(solution_order.lazy(), on="solution").sort(
+        "order", maintain_order=True
+    )
+
+    # Label each bar group by solution and version
+    lf = lf.with_columns(
+        pl.format("{} ({})", pl.col("solution").replace(SOLUTION_NAME_MAP), "version")
+        .cast(pl.Categorical)
+        .alias("group")
+    )
+
+    # Format the query number as a "Q{n}" label
     lf = lf.with_columns(pl.format("Q{}", "query_number").alias("query")).drop(
         "query_number"
     )
 
-    return lf.select("solution", "version", "query", "duration[s]").collect()
+    df = lf.select("solution", "version", "group", "query", "duration[s]").collect()
+
+    return df, solution_order
 
 
-def plot(df: pl.DataFrame) -> Figure:
+def plot(df: pl.DataFrame, solution_order: pl.DataFrame) -> Figure:
     """Generate a Plotly Figure of a grouped bar chart displaying benchmark results."""
     x = df.get_column("query")
     y = df.get_column("duration[s]")
-
-    group = df.select(
-        pl.format("{} ({})", pl.col("solution").replace(SOLUTION_NAME_MAP), "version")
-    ).to_series()
+    group = df.get_column("group")
 
     # build plotly figure object
-    color_seq = [c for (s, c) in COLORS.items() if s in df["solution"].unique()]
+    color_seq = [COLORS[s] for s in solution_order.get_column("solution")]
 
     fig = px.histogram(
         x=x,
@@ -137,7 +170,7 @@ def plot(df: pl.DataFrame) -> Figure:
         },
     )
 
-    add_annotations(fig, LIMIT, df)
+    add_annotations(fig, LIMIT, df, solution_order)
 
     write_plot_image(fig)
 
@@ -159,16 +192,9 @@ def get_title(io_type: IoType) -> str:
     return f"{title}<br><i>{subtitle}<i>"
 
 
-def add_annotations(fig: Any, limit: float, df: pl.DataFrame) -> None:
-    # order of solutions in the file
-    # e.g. ['polar', 'pandas']
-    bar_order = (
-        df.get_column("solution")
-        .unique(maintain_order=True)
-        .to_frame()
-        .with_row_index()
-    )
-
+def add_annotations(
+    fig: Any, limit: float, df: pl.DataFrame, solution_order: pl.DataFrame
+) -> None:
     # we look for the solutions that surpassed the limit
     # and create a text label for them
     df = (
@@ -178,9 +204,9 @@ def add_annotations(fig: Any, limit: float, df: pl.DataFrame) -> None:
                 "{} took {}s", "solution", pl.col("duration[s]").cast(pl.Int32)
             ).alias("labels")
         )
-        .join(bar_order, on="solution")
+        .join(solution_order, on="solution")
         .group_by("query")
-        .agg(pl.col("labels"), pl.col("index").min())
+        .agg(pl.col("labels"), pl.col("order").min())
         .with_columns(pl.col("labels").list.join(",\n"))
     )
 
@@ -190,13 +216,7 @@ def add_annotations(fig: Any, limit: float, df: pl.DataFrame) -> None:
     #         "q3": "label",
     #     }
     if df.height > 0:
-        anno_data = {
-            v[0]: v[1]
-            for v in df.select("query", "labels")
-            .transpose()
-            .to_dict(as_series=False)
-            .values()
-        }
+        anno_data = dict(df.select("query", "labels").iter_rows())
     else:
         # a dummy with no text
         anno_data = {"q1": ""}
@@ -221,7 +241,7 @@ def write_plot_image(fig: Any) -> None:
     file_name = f"plot-io-{settings.run.io_type}.html"
     print(path / file_name)
 
-    fig.write_html(path / file_name)
+    fig.write_html(path / file_name, include_plotlyjs="cdn")
 
 
 if __name__ == "__main__":